@@ -0,0 +1,4 @@
+"""Analytics package."""
+from .risk import RiskAnalytics
+
+__all__ = ["RiskAnalytics"]
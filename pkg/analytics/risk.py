@@ -0,0 +1,235 @@
+"""Columnar risk analytics across stored AIBOMs."""
+from __future__ import annotations
+from datetime import date, datetime, timezone
+from typing import Any
+import numpy as np
+from pkg.models.aibom import (
+    AIBOM,
+    AIComponent,
+    ComponentType,
+    RiskClassification,
+)
+
+_TYPES = list(ComponentType)
+_RISKS = list(RiskClassification)
+_TYPE_CODES = {t: i for i, t in enumerate(_TYPES)}
+_RISK_CODES = {r: i for i, r in enumerate(_RISKS)}
+_INTERVALS = {"day": "D", "month": "M", "year": "Y"}
+_EPOCH = date(1970, 1, 1)
+
+
+class _Interner:
+    """Maps strings to dense integer codes."""
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def code(self, value: str) -> int:
+        """Get or assign the code for a value."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class RiskAnalytics:
+    """NumPy columnar view of every stored component.
+
+    Each component is one row holding its type, risk and provider codes,
+    the index of its AIBOM and the day it entered the inventory. AIBOM
+    level attributes (organization) live in per-AIBOM columns and are
+    joined by index, so aggregates are bincounts over masked columns.
+    """
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._type = np.empty(capacity, dtype=np.int8)
+        self._risk = np.empty(capacity, dtype=np.int8)
+        self._provider = np.empty(capacity, dtype=np.int32)
+        self._aibom = np.empty(capacity, dtype=np.int32)
+        self._added_day = np.empty(capacity, dtype=np.int32)
+        self._providers = _Interner()
+        self._organizations = _Interner()
+        self._aibom_index: dict[str, int] = {}
+        self._aibom_org: list[int] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        """Grow columns geometrically to fit extra rows."""
+        needed = self._size + extra
+        capacity = len(self._type)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_type", "_risk", "_provider", "_aibom", "_added_day"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _append(
+        self,
+        aibom_idx: int,
+        components: list[AIComponent],
+        added_at: datetime,
+    ) -> None:
+        count = len(components)
+        self._reserve(count)
+        end = self._size + count
+        rows = slice(self._size, end)
+        self._type[rows] = [_TYPE_CODES[c.component_type] for c in components]
+        self._risk[rows] = [
+            _RISK_CODES[c.risk_classification] for c in components
+        ]
+        self._provider[rows] = [
+            self._providers.code(c.provider) for c in components
+        ]
+        self._aibom[rows] = aibom_idx
+        self._added_day[rows] = (
+            added_at.astimezone(timezone.utc).date() - _EPOCH
+        ).days
+        self._size = end
+
+    def add_aibom(self, aibom: AIBOM) -> None:
+        """Register an AIBOM and all of its components."""
+        if aibom.id in self._aibom_index:
+            raise ValueError(f"AIBOM already indexed: {aibom.id}")
+        aibom_idx = len(self._aibom_org)
+        self._aibom_index[aibom.id] = aibom_idx
+        self._aibom_org.append(self._organizations.code(aibom.organization))
+        self._append(aibom_idx, aibom.components, aibom.created_at)
+
+    def add_component(
+        self,
+        aibom_id: str,
+        component: AIComponent,
+        added_at: datetime | None = None,
+    ) -> None:
+        """Register a component added to an indexed AIBOM."""
+        if aibom_id not in self._aibom_index:
+            raise KeyError(aibom_id)
+        self._append(
+            self._aibom_index[aibom_id],
+            [component],
+            added_at or datetime.now(timezone.utc),
+        )
+
+    def _select(
+        self,
+        component_type: ComponentType | None,
+        risk: RiskClassification | None,
+        provider: str | None,
+        organization: str | None,
+    ) -> np.ndarray | slice:
+        """Build a row selector for the given filters."""
+        n = self._size
+        mask = None
+
+        def narrow(cond: np.ndarray) -> None:
+            nonlocal mask
+            mask = cond if mask is None else mask & cond
+
+        if component_type is not None:
+            narrow(self._type[:n] == _TYPE_CODES[component_type])
+        if risk is not None:
+            narrow(self._risk[:n] == _RISK_CODES[risk])
+        if provider is not None:
+            code = self._providers.codes.get(provider, -1)
+            narrow(self._provider[:n] == code)
+        if organization is not None:
+            code = self._organizations.codes.get(organization, -1)
+            orgs = np.asarray(self._aibom_org, dtype=np.int32)
+            narrow(orgs[self._aibom[:n]] == code)
+        return slice(None) if mask is None else mask
+
+    def summary(
+        self,
+        component_type: ComponentType | None = None,
+        risk: RiskClassification | None = None,
+        provider: str | None = None,
+        organization: str | None = None,
+        interval: str = "month",
+    ) -> dict[str, Any]:
+        """Aggregate filtered components by risk, type, provider,
+        organization and time bucket."""
+        if interval not in _INTERVALS:
+            raise ValueError(f"Unknown interval: {interval}")
+        n = self._size
+        rows = self._select(component_type, risk, provider, organization)
+        risk_col = self._risk[:n][rows]
+        type_col = self._type[:n][rows]
+        provider_col = self._provider[:n][rows]
+        aibom_col = self._aibom[:n][rows]
+        day_col = self._added_day[:n][rows]
+        orgs = np.asarray(self._aibom_org, dtype=np.int32)
+
+        by_risk = np.bincount(risk_col, minlength=len(_RISKS))
+        by_type = np.bincount(type_col, minlength=len(_TYPES))
+        by_provider = np.bincount(
+            provider_col, minlength=len(self._providers.values)
+        )
+        by_aibom = np.bincount(aibom_col, minlength=len(orgs))
+        by_org = np.bincount(
+            orgs, weights=by_aibom, minlength=len(self._organizations.values)
+        ).astype(np.int64)
+
+        return {
+            "total": int(risk_col.size),
+            "aiboms": int(np.count_nonzero(by_aibom)),
+            "by_risk": {
+                r.value: int(by_risk[i]) for i, r in enumerate(_RISKS)
+            },
+            "by_type": {
+                t.value: int(by_type[i]) for i, t in enumerate(_TYPES)
+            },
+            "by_provider": {
+                self._providers.values[i]: int(c)
+                for i, c in enumerate(by_provider) if c
+            },
+            "by_organization": {
+                self._organizations.values[i]: int(c)
+                for i, c in enumerate(by_org) if c
+            },
+            "trend": _trend(day_col, risk_col, _INTERVALS[interval]),
+        }
+
+
+def _trend(
+    day_col: np.ndarray,
+    risk_col: np.ndarray,
+    unit: str,
+) -> list[dict[str, Any]]:
+    """Count components per period and risk level.
+
+    Rows are first counted per day with one bincount over a combined
+    day/risk key; only the resulting span of days is converted to the
+    requested calendar unit and folded into periods.
+    """
+    if not day_col.size:
+        return []
+    first = int(day_col.min())
+    span = int(day_col.max()) - first + 1
+    keys = (day_col - first).astype(np.intp) * len(_RISKS) + risk_col
+    per_day = np.bincount(
+        keys, minlength=span * len(_RISKS)
+    ).reshape(span, len(_RISKS))
+    periods = (
+        np.arange(first, first + span).astype("datetime64[D]")
+        .astype(f"datetime64[{unit}]")
+    )
+    starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+    per_period = np.add.reduceat(per_day, starts, axis=0)
+    return [
+        {
+            "period": str(periods[start]),
+            "total": int(row.sum()),
+            "by_risk": {
+                r.value: int(row[i]) for i, r in enumerate(_RISKS)
+            },
+        }
+        for start, row in zip(starts, per_period) if row.any()
+    ]
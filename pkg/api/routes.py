@@ -1,14 +1,36 @@
 """FastAPI routes for AIBOM."""
 from __future__ import annotations
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from pkg.models.aibom import AIBOM, AIComponent, AIBOMValidation
+from datetime import datetime
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from pkg.models.aibom import (
+    AIBOM,
+    AIComponent,
+    AIBOMValidation,
+    ComponentType,
+    RiskClassification,
+)
+from pkg.analytics.risk import RiskAnalytics
+from pkg.history.versions import AIBOMHistory
+from pkg.index.components import ComponentIndex
+from pkg.api.streaming import (
+    AIBOMStreamParser,
+    StreamLimitExceeded,
+    StreamLimits,
+)
 from pkg.generator.builder import AIBOMBuilder
 from pkg.validator.checker import AIBOMChecker
 
 router = FastAPI(title="AIBOM Policy Engine")
 checker = AIBOMChecker()
 _aiboms: dict[str, AIBOM] = {}
+_histories: dict[str, AIBOMHistory] = {}
+_indexes: dict[str, ComponentIndex] = {}
+# Content hashes of stored AIBOMs, dropped whenever a route changes one.
+_digests: dict[str, str] = {}
+stream_limits = StreamLimits()
+analytics = RiskAnalytics()
 
 class ComponentInput(BaseModel):
     """Component input model."""
@@ -34,35 +56,162 @@ async def health():
         "aiboms_stored": len(_aiboms)
     }
 
+def _add_component(builder: AIBOMBuilder, comp_input: ComponentInput) -> None:
+    """Add a component input to a builder."""
+    if comp_input.component_type == "model":
+        builder.add_model(
+            name=comp_input.name,
+            provider=comp_input.provider,
+            version=comp_input.version,
+            description=comp_input.description,
+        )
+    elif comp_input.component_type == "tool":
+        builder.add_tool(
+            name=comp_input.name,
+            provider=comp_input.provider,
+            version=comp_input.version,
+            description=comp_input.description,
+        )
+
+def _store(aibom: AIBOM) -> None:
+    """Store a newly built AIBOM."""
+    _aiboms[aibom.id] = aibom
+    _histories[aibom.id] = AIBOMHistory(aibom)
+    _indexes[aibom.id] = ComponentIndex(aibom.components)
+    analytics.add_aibom(aibom)
+
 @router.post("/v1/aibom/create")
 async def create_aibom(input_data: AIBOMInput) -> AIBOM:
     """Create a new AIBOM."""
     builder = AIBOMBuilder(input_data.name, input_data.organization)
     for comp_input in input_data.components:
-        if comp_input.component_type == "model":
-            builder.add_model(
-                name=comp_input.name,
-                provider=comp_input.provider,
-                version=comp_input.version,
-                description=comp_input.description,
-            )
-        elif comp_input.component_type == "tool":
-            builder.add_tool(
-                name=comp_input.name,
-                provider=comp_input.provider,
-                version=comp_input.version,
-                description=comp_input.description,
-            )
+        _add_component(builder, comp_input)
     aibom = builder.build()
-    _aiboms[aibom.id] = aibom
+    _store(aibom)
     return aibom
 
+def _feed_stream(
+    parser: AIBOMStreamParser, builder: AIBOMBuilder, chunk: bytes | None
+) -> None:
+    """Parse one body chunk, or the end of the body, into a builder."""
+    items = parser.close() if chunk is None else parser.feed(chunk)
+    for item in items:
+        _add_component(builder, ComponentInput.model_validate(item))
+
+@router.post("/v1/aibom/create/stream")
+async def create_aibom_stream(request: Request):
+    """Create a new AIBOM, parsing components as the body arrives.
+
+    Parsing runs in the threadpool so large uploads do not block the
+    event loop. The parsed document is stored on the loop, like every
+    other route that changes shared state. The response is a summary
+    rather than the document, which would otherwise be serialized in
+    full.
+    """
+    content_length = request.headers.get("content-length")
+    if (
+        content_length is not None
+        and content_length.isdigit()
+        and int(content_length) > stream_limits.max_body_bytes
+    ):
+        raise HTTPException(status_code=413, detail="Request body too large")
+    parser = AIBOMStreamParser(stream_limits)
+    builder = AIBOMBuilder("")
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await run_in_threadpool(_feed_stream, parser, builder, chunk)
+        await run_in_threadpool(_feed_stream, parser, builder, None)
+        header = AIBOMInput.model_validate(parser.fields)
+    except StreamLimitExceeded as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=e.errors(include_url=False)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    builder.name = header.name
+    builder.organization = header.organization
+    aibom = builder.build()
+    _store(aibom)
+    return {
+        "id": aibom.id,
+        "name": aibom.name,
+        "component_count": len(aibom.components),
+    }
+
 @router.get("/v1/aibom/{aibom_id}")
-async def get_aibom(aibom_id: str) -> AIBOM:
-    """Get AIBOM by ID."""
+async def get_aibom(
+    aibom_id: str,
+    version: int | None = None,
+    at: datetime | None = None,
+) -> AIBOM:
+    """Get AIBOM by ID, optionally as of a version or point in time."""
     if aibom_id not in _aiboms:
         raise HTTPException(status_code=404, detail="AIBOM not found")
-    return _aiboms[aibom_id]
+    if version is None and at is None:
+        return _aiboms[aibom_id]
+    if version is not None and at is not None:
+        raise HTTPException(
+            status_code=400, detail="Specify either version or at, not both"
+        )
+    history = _histories[aibom_id]
+    try:
+        if at is not None:
+            version = history.version_at(at)
+        return history.get(version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="AIBOM version not found")
+
+@router.get("/v1/aibom/{aibom_id}/versions")
+async def list_versions(aibom_id: str):
+    """List versions of an AIBOM."""
+    if aibom_id not in _histories:
+        raise HTTPException(status_code=404, detail="AIBOM not found")
+    return {"id": aibom_id, "versions": _histories[aibom_id].versions()}
+
+@router.get("/v1/aibom/{aibom_id}/components")
+async def list_components(
+    aibom_id: str,
+    component_type: ComponentType | None = None,
+    risk_classification: RiskClassification | None = None,
+    provider: str | None = None,
+    name_prefix: str | None = None,
+    capability: str | None = None,
+    fields: str | None = None,
+    cursor: int = Query(-1, ge=-1),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """List components of an AIBOM with filters and cursor pagination."""
+    if aibom_id not in _indexes:
+        raise HTTPException(status_code=404, detail="AIBOM not found")
+    include = None
+    if fields:
+        include = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = include - set(AIComponent.model_fields)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+    page, next_cursor = _indexes[aibom_id].query(
+        component_type=component_type,
+        risk=risk_classification,
+        provider=provider,
+        name_prefix=name_prefix,
+        capability=capability,
+        after=cursor,
+        limit=limit,
+    )
+    return {
+        "aibom_id": aibom_id,
+        "count": len(page),
+        "components": [
+            comp.model_dump(mode="json", include=include) for comp in page
+        ],
+        "next_cursor": next_cursor,
+    }
 
 @router.post("/v1/aibom/{aibom_id}/validate")
 async def validate_aibom(aibom_id: str) -> AIBOMValidation:
@@ -70,7 +219,15 @@ async def validate_aibom(aibom_id: str) -> AIBOMValidation:
     if aibom_id not in _aiboms:
         raise HTTPException(status_code=404, detail="AIBOM not found")
     aibom = _aiboms[aibom_id]
-    return checker.validate(aibom)
+    result, _digests[aibom_id] = checker.validate_with_digest(
+        aibom, _digests.get(aibom_id)
+    )
+    return result
+
+@router.get("/v1/validator/cache")
+async def validation_cache_stats():
+    """Validation cache counters."""
+    return checker.cache.stats()
 
 @router.post("/v1/components")
 async def add_component(aibom_id: str, component: ComponentInput):
@@ -87,7 +244,11 @@ async def add_component(aibom_id: str, component: ComponentInput):
         description=component.description,
     )
     aibom.components.append(comp)
-    return {"added": True, "component_id": comp.id}
+    _digests.pop(aibom_id, None)
+    version = _histories[aibom_id].commit(added=[comp])
+    _indexes[aibom_id].add(comp)
+    analytics.add_component(aibom_id, comp)
+    return {"added": True, "component_id": comp.id, "version": version}
 
 @router.get("/v1/aiboms")
 async def list_aiboms():
@@ -97,3 +258,23 @@ async def list_aiboms():
         "aiboms": [{"id": id, "name": aibom.name} 
                    for id, aibom in _aiboms.items()]
     }
+
+@router.get("/v1/analytics/risk")
+async def risk_analytics(
+    component_type: ComponentType | None = None,
+    risk_classification: RiskClassification | None = None,
+    provider: str | None = None,
+    organization: str | None = None,
+    interval: str = "month",
+):
+    """Risk roll-up across all stored AIBOMs."""
+    try:
+        return analytics.summary(
+            component_type=component_type,
+            risk=risk_classification,
+            provider=provider,
+            organization=organization,
+            interval=interval,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
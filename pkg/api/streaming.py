@@ -0,0 +1,207 @@
+"""Incremental parsing of AIBOM create requests."""
+from __future__ import annotations
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# JSON structure is ASCII, so scanning UTF-8 bytes never splits a
+# multi-byte character at a delimiter.
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+
+
+class StreamLimitExceeded(ValueError):
+    """Raised when a streamed request exceeds a configured limit."""
+
+
+@dataclass
+class StreamLimits:
+    """Limits enforced while streaming an AIBOM create request."""
+    max_body_bytes: int = 512 * 1024 * 1024
+    max_components: int = 1_000_000
+    max_item_bytes: int = 1024 * 1024
+
+
+class AIBOMStreamParser:
+    """Push parser for ``{"name": ..., "components": [...]}`` bodies.
+
+    Bytes are fed in arbitrary chunks and each complete element of the
+    ``components`` array is returned as soon as it has been read, so
+    only the current element is ever buffered. Scan state for an
+    incomplete element is kept between chunks, so every byte is scanned
+    once and decoded once. Other top-level fields are collected into
+    ``fields``.
+    """
+    def __init__(self, limits: StreamLimits | None = None) -> None:
+        self.limits = limits or StreamLimits()
+        self.fields: dict[str, Any] = {}
+        self.bytes_read = 0
+        self.component_count = 0
+        self._decoder = json.JSONDecoder()
+        self._buf = bytearray()
+        self._pos = 0
+        self._state = "start"
+        self._key = ""
+        self._closed = False
+        # Scan state of the element starting at self._pos.
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        """Consume a chunk and return the components it completed."""
+        self.bytes_read += len(data)
+        if self.bytes_read > self.limits.max_body_bytes:
+            raise StreamLimitExceeded(
+                f"Request body exceeds {self.limits.max_body_bytes} bytes"
+            )
+        # Drop consumed input once it dominates the buffer, keeping
+        # compaction amortized O(1) per byte.
+        if self._pos * 2 >= len(self._buf):
+            del self._buf[:self._pos]
+            self._pos = 0
+        self._buf += data
+        return self._parse()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal end of input and return any remaining components."""
+        self._closed = True
+        components = self._parse()
+        if self._state != "end":
+            raise ValueError("Unexpected end of AIBOM document")
+        return components
+
+    def _skip(self) -> bytes:
+        """Skip whitespace and return the next byte, or b''."""
+        self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+        return bytes(self._buf[self._pos:self._pos + 1])
+
+    def _element_end(self) -> int | None:
+        """End of the element at the cursor, or None if incomplete."""
+        buf = self._buf
+        i = self._pos + self._scanned
+        if buf[self._pos:self._pos + 1] not in (b"{", b"[", b'"'):
+            match = _SCALAR_END.search(buf, i)
+            if match:
+                return match.start()
+            if self._closed:
+                return len(buf)
+            self._scanned = len(buf) - self._pos
+            return None
+        while True:
+            pattern = _STRING_SPECIAL if self._in_string else _STRUCTURE
+            match = pattern.search(buf, i)
+            if match is None:
+                # A pending escape may already point past the buffer.
+                i = max(i, len(buf))
+                break
+            char = match.group()
+            i = match.end()
+            if char == b"\\":
+                i += 1
+            elif char == b'"':
+                self._in_string = not self._in_string
+                if not self._in_string and self._depth == 0:
+                    return i
+            elif char in (b"{", b"["):
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return i
+        self._scanned = i - self._pos
+        return None
+
+    def _value(self) -> tuple[bool, Any]:
+        """Decode one JSON value, or report that more input is needed."""
+        end = self._element_end()
+        if end is None:
+            if self._closed:
+                raise ValueError("Malformed AIBOM document")
+            if len(self._buf) - self._pos > self.limits.max_item_bytes:
+                raise StreamLimitExceeded(
+                    f"Element exceeds {self.limits.max_item_bytes} bytes"
+                )
+            return False, None
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+        try:
+            text = self._buf[self._pos:end].decode()
+            value, decoded_end = self._decoder.raw_decode(text)
+        except ValueError:
+            raise ValueError("Malformed AIBOM document")
+        if decoded_end != len(text):
+            raise ValueError("Malformed AIBOM document")
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: bytes, allowed: bytes) -> None:
+        if char not in allowed:
+            raise ValueError(f"Malformed AIBOM document at {char!r}")
+        self._pos += 1
+
+    def _parse(self) -> list[dict[str, Any]]:
+        components: list[dict[str, Any]] = []
+        while True:
+            char = self._skip()
+            if not char:
+                return components
+            state = self._state
+            if state == "start":
+                self._expect(char, b"{")
+                self._state = "first_key"
+            elif state in ("key", "first_key"):
+                if char == b"}" and state == "first_key":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                if char != b'"':
+                    raise ValueError(f"Malformed AIBOM document at {char!r}")
+                done, key = self._value()
+                if not done:
+                    return components
+                self._key = key
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(char, b":")
+                self._state = "value"
+            elif state == "value":
+                if self._key == "components" and char == b"[":
+                    self._pos += 1
+                    self._state = "first_item"
+                    continue
+                done, value = self._value()
+                if not done:
+                    return components
+                if self._key == "components" and value is not None:
+                    raise ValueError("components must be an array")
+                if self._key != "components":
+                    self.fields[self._key] = value
+                self._state = "after_value"
+            elif state == "after_value":
+                self._expect(char, b",}")
+                self._state = "key" if char == b"," else "end"
+            elif state in ("item", "first_item"):
+                if char == b"]" and state == "first_item":
+                    self._pos += 1
+                    self._state = "after_value"
+                    continue
+                done, value = self._value()
+                if not done:
+                    return components
+                self.component_count += 1
+                if self.component_count > self.limits.max_components:
+                    raise StreamLimitExceeded(
+                        f"More than {self.limits.max_components} components"
+                    )
+                components.append(value)
+                self._state = "after_item"
+            elif state == "after_item":
+                self._expect(char, b",]")
+                self._state = "item" if char == b"," else "after_value"
+            else:
+                raise ValueError("Unexpected data after AIBOM document")
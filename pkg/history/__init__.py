@@ -0,0 +1,4 @@
+"""History package."""
+from .versions import AIBOMHistory
+
+__all__ = ["AIBOMHistory"]
@@ -0,0 +1,213 @@
+"""Versioned AIBOM history with shared components."""
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable
+from pkg.models.aibom import AIBOM, AIComponent
+
+_HEADER_FIELDS = (
+    "id", "name", "version", "created_at",
+    "organization", "dependencies", "metadata",
+)
+
+
+@dataclass(frozen=True)
+class _Version:
+    """One entry in the history.
+
+    ``added`` is a half-open range of positions in the component log and
+    ``removed`` the log positions dropped by this version. ``checkpoint``
+    holds the sorted live positions when present.
+    """
+    header: dict[str, Any]
+    timestamp: float
+    added: tuple[int, int]
+    removed: tuple[int, ...] = ()
+    checkpoint: array | None = None
+
+
+class AIBOMHistory:
+    """Append-only version history of a single AIBOM.
+
+    Every component object is stored once in a shared log, and a version
+    records only the log positions it adds and removes. A full
+    checkpoint of live positions is written once the components changed
+    since the previous checkpoint reach ``checkpoint_ratio`` of the
+    document size. Memory therefore grows with the volume of changes,
+    and reading any version replays at most about one document's worth
+    of deltas regardless of how many versions exist.
+
+    Component IDs need not be unique: committed components are always
+    appended, as ``POST /v1/components`` does, and removing an ID drops
+    every live component carrying it. Replacing a component is a commit
+    that removes its ID and adds the new one.
+    """
+    def __init__(
+        self,
+        aibom: AIBOM,
+        checkpoint_ratio: float = 0.5,
+        min_checkpoint: int = 64,
+    ) -> None:
+        if checkpoint_ratio <= 0:
+            raise ValueError("checkpoint_ratio must be positive")
+        self.checkpoint_ratio = checkpoint_ratio
+        self.min_checkpoint = min_checkpoint
+        self._log: list[AIComponent] = list(aibom.components)
+        # Live log positions per component ID, in log order.
+        self._live: dict[str, list[int]] = {}
+        for i, comp in enumerate(self._log):
+            self._live.setdefault(comp.id, []).append(i)
+        self._live_count = len(self._log)
+        self._versions: list[_Version] = []
+        self._timestamps: list[float] = []
+        self._pending = 0
+        header = {
+            field: getattr(aibom, field) for field in _HEADER_FIELDS
+        }
+        header["dependencies"] = list(aibom.dependencies)
+        header["metadata"] = dict(aibom.metadata)
+        self._append(
+            _Version(
+                header=header,
+                timestamp=aibom.created_at.timestamp(),
+                added=(0, len(self._log)),
+                checkpoint=array("q", range(len(self._log))),
+            )
+        )
+
+    @property
+    def head(self) -> int:
+        """Latest version number (versions start at 1)."""
+        return len(self._versions)
+
+    def _append(self, version: _Version) -> None:
+        self._versions.append(version)
+        self._timestamps.append(version.timestamp)
+
+    def commit(
+        self,
+        added: Iterable[AIComponent] = (),
+        removed_ids: Iterable[str] = (),
+        at: datetime | None = None,
+        **header_changes: Any,
+    ) -> int:
+        """Record a new version and return its number.
+
+        All arguments are checked before anything is changed, so a
+        rejected commit leaves the history untouched.
+        """
+        unknown = set(header_changes) - set(_HEADER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown AIBOM fields: {sorted(unknown)}")
+        added = list(added)
+        removed_ids = list(dict.fromkeys(removed_ids))
+        missing = [cid for cid in removed_ids if cid not in self._live]
+        if missing:
+            raise ValueError(f"Unknown component IDs: {missing}")
+
+        previous = self._versions[-1]
+        header = previous.header
+        if header_changes:
+            header = {**header, **header_changes}
+            for field in ("dependencies", "metadata"):
+                header[field] = type(header[field])(header[field])
+        timestamp = max(
+            (at or datetime.now(timezone.utc)).timestamp(),
+            previous.timestamp,
+        )
+
+        removed = tuple(
+            pos for cid in removed_ids for pos in self._live.pop(cid)
+        )
+        start = len(self._log)
+        for comp in added:
+            self._live.setdefault(comp.id, []).append(len(self._log))
+            self._log.append(comp)
+        end = len(self._log)
+        self._live_count += (end - start) - len(removed)
+
+        self._pending += (end - start) + len(removed)
+        checkpoint = None
+        threshold = max(
+            self.min_checkpoint, self.checkpoint_ratio * self._live_count
+        )
+        if self._pending >= threshold:
+            checkpoint = self._checkpoint()
+        self._append(
+            _Version(
+                header=header,
+                timestamp=timestamp,
+                added=(start, end),
+                removed=removed,
+                checkpoint=checkpoint,
+            )
+        )
+        return self.head
+
+    def _checkpoint(self) -> array:
+        """Snapshot live positions and reset the pending change count."""
+        self._pending = 0
+        return array(
+            "q", sorted(pos for group in self._live.values() for pos in group)
+        )
+
+    def compact(self) -> None:
+        """Fold pending deltas into a checkpoint at the head version."""
+        if self._pending == 0:
+            return
+        last = self._versions[-1]
+        self._versions[-1] = _Version(
+            header=last.header,
+            timestamp=last.timestamp,
+            added=last.added,
+            removed=last.removed,
+            checkpoint=self._checkpoint(),
+        )
+
+    def versions(self) -> list[dict[str, Any]]:
+        """Version numbers with their commit times."""
+        return [
+            {
+                "version": i + 1,
+                "timestamp": datetime.fromtimestamp(ts, timezone.utc),
+            }
+            for i, ts in enumerate(self._timestamps)
+        ]
+
+    def version_at(self, at: datetime) -> int:
+        """Latest version committed at or before a point in time."""
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        version = bisect_right(self._timestamps, at.timestamp())
+        if version == 0:
+            raise KeyError(f"No version at {at.isoformat()}")
+        return version
+
+    def get(self, version: int | None = None) -> AIBOM:
+        """Materialize a version (defaults to the head)."""
+        if version is None:
+            version = self.head
+        if not 1 <= version <= self.head:
+            raise KeyError(f"No version {version}")
+        base = version - 1
+        while self._versions[base].checkpoint is None:
+            base -= 1
+        # Log positions are never reused, so removals across the whole
+        # chain can be applied in a single pass after all additions.
+        positions = list(self._versions[base].checkpoint)
+        dropped: set[int] = set()
+        for entry in self._versions[base + 1:version]:
+            positions.extend(range(*entry.added))
+            dropped.update(entry.removed)
+        if dropped:
+            positions = [p for p in positions if p not in dropped]
+        header = self._versions[version - 1].header
+        # Components are shared, already-validated objects.
+        return AIBOM.model_construct(**{
+            **header,
+            "dependencies": list(header["dependencies"]),
+            "metadata": dict(header["metadata"]),
+            "components": [self._log[p] for p in positions],
+        })
@@ -0,0 +1,4 @@
+"""Index package."""
+from .components import ComponentIndex
+
+__all__ = ["ComponentIndex"]
@@ -0,0 +1,124 @@
+"""Per-document component indexes for filtered listing."""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Iterable, Sequence
+from pkg.models.aibom import AIComponent, ComponentType, RiskClassification
+
+
+class ComponentIndex:
+    """Posting lists over the components of one AIBOM.
+
+    Each index maps a value to the ascending positions of the components
+    that carry it, and names are kept sorted for prefix lookups. A query
+    walks the smallest matching posting list from the cursor and checks
+    the remaining filters on the component itself, so it never scans
+    components that the most selective filter already excludes. Name
+    prefixes are sized with two bisections and expanded into sorted
+    positions whenever they are the most selective filter; the latest
+    expansion is kept so paging through a prefix sorts it only once.
+    """
+    def __init__(self, components: Iterable[AIComponent] = ()) -> None:
+        self._components: list[AIComponent] = []
+        self._by_type: dict[ComponentType, list[int]] = defaultdict(list)
+        self._by_risk: dict[RiskClassification, list[int]] = defaultdict(list)
+        self._by_provider: dict[str, list[int]] = defaultdict(list)
+        self._by_capability: dict[str, list[int]] = defaultdict(list)
+        self._names: list[tuple[str, int]] = []
+        self._expanded: tuple[tuple[int, int], list[int]] | None = None
+        for comp in components:
+            self._names.append((comp.name, self._append(comp)))
+        self._names.sort()
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def add(self, component: AIComponent) -> None:
+        """Index a component appended to the document."""
+        insort(self._names, (component.name, self._append(component)))
+        self._expanded = None
+
+    def _append(self, component: AIComponent) -> int:
+        """Add a component to every index except names."""
+        pos = len(self._components)
+        self._components.append(component)
+        self._by_type[component.component_type].append(pos)
+        self._by_risk[component.risk_classification].append(pos)
+        self._by_provider[component.provider].append(pos)
+        for capability in set(component.capabilities):
+            self._by_capability[capability].append(pos)
+        return pos
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        """Slice of the sorted names that start with a prefix."""
+        start = bisect_left(self._names, (prefix,))
+        last = ord(prefix[-1])
+        if last == 0x10FFFF:
+            return start, len(self._names)
+        upper = prefix[:-1] + chr(last + 1)
+        return start, bisect_left(self._names, (upper,), lo=start)
+
+    def _prefix_positions(self, start: int, end: int) -> list[int]:
+        """Ascending positions of a slice of the sorted names."""
+        if self._expanded is None or self._expanded[0] != (start, end):
+            self._expanded = (
+                (start, end), sorted(pos for _, pos in self._names[start:end])
+            )
+        return self._expanded[1]
+
+    def query(
+        self,
+        component_type: ComponentType | None = None,
+        risk: RiskClassification | None = None,
+        provider: str | None = None,
+        name_prefix: str | None = None,
+        capability: str | None = None,
+        after: int = -1,
+        limit: int = 100,
+    ) -> tuple[list[AIComponent], int | None]:
+        """Matching components after a cursor position.
+
+        Returns up to ``limit`` components and the cursor for the next
+        page, or None when there are no more matches.
+        """
+        candidates: list[list[int]] = []
+        if component_type is not None:
+            candidates.append(self._by_type.get(component_type, []))
+        if risk is not None:
+            candidates.append(self._by_risk.get(risk, []))
+        if provider is not None:
+            candidates.append(self._by_provider.get(provider, []))
+        if capability is not None:
+            candidates.append(self._by_capability.get(capability, []))
+        driver: Sequence[int] = (
+            min(candidates, key=len) if candidates
+            else range(len(self._components))
+        )
+        if name_prefix:
+            # Drive from the prefix matches whenever there are fewer of
+            # them than of the current driver.
+            start, end = self._prefix_range(name_prefix)
+            if end - start < len(driver):
+                driver = self._prefix_positions(start, end)
+
+        def matches(comp: AIComponent) -> bool:
+            return (
+                (component_type is None or comp.component_type == component_type)
+                and (risk is None or comp.risk_classification == risk)
+                and (provider is None or comp.provider == provider)
+                and (capability is None or capability in comp.capabilities)
+                and (not name_prefix or comp.name.startswith(name_prefix))
+            )
+
+        page: list[AIComponent] = []
+        last = after
+        for i in range(bisect_right(driver, after), len(driver)):
+            pos = driver[i]
+            comp = self._components[pos]
+            if not matches(comp):
+                continue
+            if len(page) == limit:
+                return page, last
+            page.append(comp)
+            last = pos
+        return page, None
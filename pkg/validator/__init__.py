@@ -1,4 +1,12 @@
 """Validator package."""
 from .checker import AIBOMChecker
+from .cache import ValidationCache, content_hash
+from .parallel import ParallelValidation, validate_parallel
 
-__all__ = ["AIBOMChecker"]
+__all__ = [
+    "AIBOMChecker",
+    "ParallelValidation",
+    "ValidationCache",
+    "content_hash",
+    "validate_parallel",
+]
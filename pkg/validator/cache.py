@@ -0,0 +1,119 @@
+"""Content-addressed cache for validation results."""
+from __future__ import annotations
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
+from pkg.models.aibom import AIBOM, AIBOMValidation, AIComponent
+
+# Digests are built from fixed-size blocks so the parallel validator can
+# hash blocks in its workers and arrive at the same key.
+HASH_BLOCK = 1024
+
+
+def component_block_digest(components: Sequence[AIComponent]) -> bytes:
+    """Digest of the rule-relevant fields of a block of components."""
+    fields: list[str] = []
+    for comp in components:
+        fields += (
+            comp.id,
+            comp.name,
+            comp.component_type.value,
+            comp.risk_classification.value,
+            comp.provider,
+            comp.description,
+        )
+    return hashlib.blake2b(repr(fields).encode(), digest_size=16).digest()
+
+
+def dependency_block_digest(dependencies: Sequence[dict[str, Any]]) -> bytes:
+    """Digest of the endpoints of a block of dependencies."""
+    endpoints = [(dep.get("from"), dep.get("to")) for dep in dependencies]
+    return hashlib.blake2b(repr(endpoints).encode(), digest_size=16).digest()
+
+
+def combine_digests(
+    component_digests: Iterable[bytes],
+    dependency_digests: Iterable[bytes],
+) -> str:
+    """Combine block digests into a content hash."""
+    h = hashlib.sha256(b"components")
+    for digest in component_digests:
+        h.update(digest)
+    h.update(b"dependencies")
+    for digest in dependency_digests:
+        h.update(digest)
+    return h.hexdigest()
+
+
+def _blocks(items: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    return (
+        items[start:start + HASH_BLOCK]
+        for start in range(0, len(items), HASH_BLOCK)
+    )
+
+
+def content_hash(aibom: AIBOM) -> str:
+    """Hash of the fields validation reads.
+
+    Only component IDs, names, types, risk levels, providers and
+    descriptions and the dependency endpoints are hashed, so the same
+    inventory stored under a new ID or with different metadata shares a
+    key. The hash is recomputed on every call; callers that control
+    when a document changes can keep it and pass it to
+    ``AIBOMChecker.validate``.
+    """
+    return combine_digests(
+        map(component_block_digest, _blocks(aibom.components)),
+        map(dependency_block_digest, _blocks(aibom.dependencies)),
+    )
+
+
+class ValidationCache:
+    """Bounded LRU cache of validation results."""
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, AIBOMValidation] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> AIBOMValidation | None:
+        """Look up a result and mark it most recently used."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return result.model_copy(deep=True)
+
+    def put(self, key: str, result: AIBOMValidation) -> None:
+        """Store a result, evicting the least recently used entry."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = result.model_copy(deep=True)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and occupancy."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
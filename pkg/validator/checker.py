@@ -1,49 +1,117 @@
 """AIBOM validation checker."""
 from __future__ import annotations
-from pkg.models.aibom import AIBOM, AIBOMValidation, RiskClassification
+from typing import Callable
+from pkg.models.aibom import AIBOM, AIBOMValidation
+from pkg.validator.cache import ValidationCache, content_hash
+from pkg.validator.parallel import ParallelValidation, fork_available
+from pkg.validator.rules import check_components, check_dependencies
 
 class AIBOMChecker:
-    """Validates AIBOM documents."""
-    def validate(self, aibom: AIBOM) -> AIBOMValidation:
-        """Validate an AIBOM document."""
-        errors = []
-        warnings = []
-        
-        # Check all components have IDs
-        for i, comp in enumerate(aibom.components):
-            if not comp.id:
-                errors.append(f"Component {i} missing ID")
-        
+    """Validates AIBOM documents.
+
+    Results are cached by the document's content hash together with the
+    active rule-set version; changing the version clears the cache.
+    With ``workers`` above one, documents with at least
+    ``parallel_threshold`` components and dependencies are validated in
+    chunks on a process pool, with output identical to serial runs. The
+    workers hash such documents before the cache lookup and run the
+    rules only on a miss. The pool needs the fork start method;
+    ``start_method`` defaults to the platform's, and documents are
+    validated serially when it does not fork.
+    """
+    RULESET_VERSION = "1"
+
+    def __init__(
+        self,
+        cache_size: int = 1024,
+        workers: int = 1,
+        chunk_size: int = 50_000,
+        parallel_threshold: int = 200_000,
+        start_method: str | None = None,
+    ) -> None:
+        self.cache = ValidationCache(cache_size)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.start_method = start_method
+        self._ruleset_version = self.RULESET_VERSION
+
+    @property
+    def ruleset_version(self) -> str:
+        """Version of the active rule set."""
+        return self._ruleset_version
+
+    @ruleset_version.setter
+    def ruleset_version(self, version: str) -> None:
+        if version != self._ruleset_version:
+            self._ruleset_version = version
+            self.cache.clear()
+
+    def validate(
+        self, aibom: AIBOM, digest: str | None = None
+    ) -> AIBOMValidation:
+        """Validate an AIBOM document.
+
+        ``digest`` is the document's ``content_hash`` if the caller
+        already has it, and is computed otherwise.
+        """
+        return self.validate_with_digest(aibom, digest)[0]
+
+    def validate_with_digest(
+        self, aibom: AIBOM, digest: str | None = None
+    ) -> tuple[AIBOMValidation, str]:
+        """Validate an AIBOM and return the content hash used as key."""
+        if not self._parallel(aibom):
+            if digest is None:
+                digest = content_hash(aibom)
+            return self._cached(digest, lambda: self._check(aibom)), digest
+        with ParallelValidation(
+            aibom, self.workers, self.chunk_size, self.start_method
+        ) as run:
+            if digest is None:
+                digest = run.content_hash()
+            return self._cached(digest, run.validate), digest
+
+    def _cached(
+        self, digest: str, check: Callable[[], AIBOMValidation]
+    ) -> AIBOMValidation:
+        """Look a result up by content hash, running ``check`` on a miss."""
+        key = f"{self._ruleset_version}:{digest}"
+        result = self.cache.get(key)
+        if result is None:
+            result = check()
+            self.cache.put(key, result)
+        return result
+
+    def _parallel(self, aibom: AIBOM) -> bool:
+        """Whether an AIBOM is validated on the process pool."""
+        return (
+            self.workers > 1
+            and len(aibom.components) + len(aibom.dependencies)
+            >= self.parallel_threshold
+            and fork_available(self.start_method)
+        )
+
+    def _check(self, aibom: AIBOM) -> AIBOMValidation:
+        """Run all rules against an AIBOM in this process."""
+        missing_ids, undescribed, unprovided = check_components(
+            aibom.components
+        )
+        errors = missing_ids
+
         # Check for duplicate IDs
         ids = [c.id for c in aibom.components if c.id]
         if len(ids) != len(set(ids)):
             errors.append("Duplicate component IDs found")
-        
-        # Check dependencies reference valid components
+
         valid_ids = {c.id for c in aibom.components}
-        for dep in aibom.dependencies:
-            from_id = dep.get("from")
-            to_id = dep.get("to")
-            if from_id not in valid_ids:
-                errors.append(f"Dependency references unknown component: {from_id}")
-            if to_id not in valid_ids:
-                errors.append(f"Dependency references unknown component: {to_id}")
-        
-        # Check high-risk components have descriptions
-        for comp in aibom.high_risk_components:
-            if not comp.description:
-                warnings.append(
-                    f"High-risk component '{comp.name}' missing description"
-                )
-        
-        # Check models have providers
-        for comp in aibom.components:
-            if comp.component_type.value == "model" and not comp.provider:
-                warnings.append(f"Model '{comp.name}' missing provider")
-        
-        valid = len(errors) == 0
+        errors.extend(check_dependencies(
+            aibom.dependencies,
+            lambda values: [v in valid_ids for v in values],
+        ))
+
         return AIBOMValidation(
-            valid=valid,
+            valid=len(errors) == 0,
             errors=errors,
-            warnings=warnings,
+            warnings=undescribed + unprovided,
         )
@@ -0,0 +1,225 @@
+"""Chunked validation of a single AIBOM on a process pool.
+
+Workers are forked, so they inherit the document and its component ID
+set through copy-on-write memory instead of receiving pickled copies;
+other start methods are not supported.
+"""
+from __future__ import annotations
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import wait
+from typing import AbstractSet, Any, Sequence
+from pkg.models.aibom import AIBOM, AIBOMValidation, AIComponent
+from pkg.validator.cache import (
+    HASH_BLOCK,
+    combine_digests,
+    component_block_digest,
+    dependency_block_digest,
+)
+from pkg.validator.rules import check_components, check_dependencies
+
+_components: Sequence[AIComponent] = ()
+_dependencies: Sequence[dict[str, Any]] = ()
+_ids: AbstractSet[str] = frozenset()
+
+
+def fork_available(start_method: str | None = None) -> bool:
+    """Whether a start method, or the platform default, forks workers."""
+    try:
+        context = multiprocessing.get_context(start_method)
+    except ValueError:
+        return False
+    return context.get_start_method() == "fork"
+
+
+def _init_worker(
+    components: Sequence[AIComponent],
+    dependencies: Sequence[dict[str, Any]],
+    ids: AbstractSet[str] = frozenset(),
+) -> None:
+    """Point a forked worker at the document it inherited."""
+    global _components, _dependencies, _ids
+    _components = components
+    _dependencies = dependencies
+    _ids = ids
+    parent = multiprocessing.parent_process()
+    if parent is not None and parent.sentinel is not None:
+        threading.Thread(
+            target=_exit_with_parent, args=(parent.sentinel,), daemon=True
+        ).start()
+
+
+def _exit_with_parent(sentinel: int) -> None:
+    """Exit once the parent is gone instead of blocking on the queue."""
+    wait([sentinel])
+    os._exit(1)
+
+
+def _component_blocks(start: int, end: int) -> list[bytes]:
+    """Hash block digests of a block-aligned range of components."""
+    return [
+        component_block_digest(_components[block:block + HASH_BLOCK])
+        for block in range(start, end, HASH_BLOCK)
+    ]
+
+
+def _dependency_blocks(start: int, end: int) -> list[bytes]:
+    """Hash block digests of a block-aligned range of dependencies."""
+    return [
+        dependency_block_digest(_dependencies[block:block + HASH_BLOCK])
+        for block in range(start, end, HASH_BLOCK)
+    ]
+
+
+def _component_chunk(
+    start: int, end: int
+) -> tuple[list[str], list[str], list[str]]:
+    """Per-component rules for one chunk."""
+    return check_components(_components[start:end], start)
+
+
+def _dependency_chunk(start: int, end: int) -> list[str]:
+    """Dependency rules for one chunk."""
+    # Set lookups only read the inherited set, so its pages stay shared.
+    return check_dependencies(
+        _dependencies[start:end],
+        lambda values: [value in _ids for value in values],
+    )
+
+
+def _ranges(
+    total: int, chunk_size: int, workers: int, align: int = 1
+) -> tuple[list[int], list[int]]:
+    """Start and end offsets of consecutive chunks.
+
+    Chunks hold at most ``chunk_size`` items rounded up to a multiple of
+    ``align``, and their count is a multiple of ``workers`` so that every
+    worker gets an even share.
+    """
+    units = -(-total // align)
+    chunks = -(-units // max(-(-chunk_size // align), 1))
+    chunks = -(-chunks // workers) * workers
+    size = max(-(-units // max(chunks, 1)), 1) * align
+    starts = list(range(0, total, size))
+    return starts, [min(start + size, total) for start in starts]
+
+
+class ParallelValidation:
+    """One AIBOM hashed and validated on a forked process pool.
+
+    The pool starts on first use and is shared by ``content_hash`` and
+    ``validate``, so a caller can hash the document, consult its cache
+    and run the rules only on a miss without forking twice. Call
+    ``close`` (or use the instance as a context manager) to stop the
+    workers, which also exit if the parent dies.
+
+    The parent collects the component IDs into a set before forking, so
+    workers check dependency endpoints against it without a copy.
+    Chunk results are combined in document order, so the output matches
+    serial validation exactly.
+    """
+    def __init__(
+        self,
+        aibom: AIBOM,
+        workers: int,
+        chunk_size: int = 50_000,
+        start_method: str | None = None,
+    ) -> None:
+        if not fork_available(start_method):
+            raise ValueError(
+                "Parallel validation requires the fork start method"
+            )
+        self.aibom = aibom
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.start_method = start_method
+        self._pool: ProcessPoolExecutor | None = None
+        self._duplicates = False
+
+    def __enter__(self) -> ParallelValidation:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """The worker pool, forked on first use."""
+        if self._pool is None:
+            ids = [comp.id for comp in self.aibom.components]
+            id_set = set(ids)
+            self._duplicates = (
+                len(id_set) - ("" in id_set) != len(ids) - ids.count("")
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(
+                    self.aibom.components, self.aibom.dependencies, id_set
+                ),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def content_hash(self) -> str:
+        """The document's ``content_hash``, computed by the workers."""
+        pool = self._executor()
+        component_blocks = pool.map(_component_blocks, *_ranges(
+            len(self.aibom.components), self.chunk_size, self.workers,
+            HASH_BLOCK,
+        ))
+        dependency_blocks = pool.map(_dependency_blocks, *_ranges(
+            len(self.aibom.dependencies), self.chunk_size, self.workers,
+            HASH_BLOCK,
+        ))
+        return combine_digests(
+            (digest for blocks in component_blocks for digest in blocks),
+            (digest for blocks in dependency_blocks for digest in blocks),
+        )
+
+    def validate(self) -> AIBOMValidation:
+        """Run all rules against the document."""
+        pool = self._executor()
+        component_results = pool.map(_component_chunk, *_ranges(
+            len(self.aibom.components), self.chunk_size, self.workers
+        ))
+        dependency_results = pool.map(_dependency_chunk, *_ranges(
+            len(self.aibom.dependencies), self.chunk_size, self.workers
+        ))
+        missing_ids, undescribed, unprovided = [], [], []
+        for findings in component_results:
+            missing_ids.extend(findings[0])
+            undescribed.extend(findings[1])
+            unprovided.extend(findings[2])
+        errors = missing_ids
+        if self._duplicates:
+            errors.append("Duplicate component IDs found")
+        for dep_errors in dependency_results:
+            errors.extend(dep_errors)
+        return AIBOMValidation(
+            valid=len(errors) == 0,
+            errors=errors,
+            warnings=undescribed + unprovided,
+        )
+
+
+def validate_parallel(
+    aibom: AIBOM,
+    workers: int,
+    chunk_size: int = 50_000,
+    start_method: str | None = None,
+) -> AIBOMValidation:
+    """Validate an AIBOM in chunks across forked worker processes.
+
+    ``start_method`` defaults to the platform's and must fork; see
+    ``ParallelValidation``.
+    """
+    with ParallelValidation(aibom, workers, chunk_size, start_method) as run:
+        return run.validate()
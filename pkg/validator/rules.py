@@ -0,0 +1,53 @@
+"""Validation rules over contiguous slices of an AIBOM."""
+from __future__ import annotations
+from typing import Any, Callable, Sequence
+from pkg.models.aibom import AIComponent, ComponentType, RiskClassification
+
+_HIGH_RISK = (RiskClassification.HIGH, RiskClassification.UNACCEPTABLE)
+
+
+def check_components(
+    components: Sequence[AIComponent],
+    offset: int = 0,
+) -> tuple[list[str], list[str], list[str]]:
+    """Per-component rules.
+
+    Returns missing-ID errors, high-risk description warnings and model
+    provider warnings, each in component order. ``offset`` is the index
+    of the first component in the full document.
+    """
+    missing_ids = []
+    undescribed = []
+    unprovided = []
+    for i, comp in enumerate(components, offset):
+        if not comp.id:
+            missing_ids.append(f"Component {i} missing ID")
+        if comp.risk_classification in _HIGH_RISK and not comp.description:
+            undescribed.append(
+                f"High-risk component '{comp.name}' missing description"
+            )
+        if comp.component_type == ComponentType.MODEL and not comp.provider:
+            unprovided.append(f"Model '{comp.name}' missing provider")
+    return missing_ids, undescribed, unprovided
+
+
+def check_dependencies(
+    dependencies: Sequence[dict[str, Any]],
+    contains: Callable[[list[Any]], Sequence[bool]],
+) -> list[str]:
+    """Errors for dependencies that reference unknown components.
+
+    ``contains`` maps a list of IDs to their membership in the
+    document's component ID set.
+    """
+    from_ids = [dep.get("from") for dep in dependencies]
+    to_ids = [dep.get("to") for dep in dependencies]
+    errors = []
+    for from_id, to_id, from_known, to_known in zip(
+        from_ids, to_ids, contains(from_ids), contains(to_ids)
+    ):
+        if not from_known:
+            errors.append(f"Dependency references unknown component: {from_id}")
+        if not to_known:
+            errors.append(f"Dependency references unknown component: {to_id}")
+    return errors
@@ -0,0 +1,71 @@
+"""Test RiskAnalytics."""
+import pytest
+from datetime import datetime, timezone
+from pkg.analytics.risk import RiskAnalytics
+from pkg.generator.builder import AIBOMBuilder
+from pkg.models.aibom import AIComponent, ComponentType, RiskClassification
+
+@pytest.fixture
+def analytics():
+    """Create analytics with two AIBOMs."""
+    analytics = RiskAnalytics(capacity=2)
+    first = AIBOMBuilder("First", "OrgA")
+    first.add_model("GPT-4", "OpenAI", risk=RiskClassification.HIGH)
+    first.add_model("Claude", "Anthropic")
+    first.add_tool("Search", "Internal")
+    aibom = first.build()
+    aibom.created_at = datetime(2026, 1, 15, tzinfo=timezone.utc)
+    analytics.add_aibom(aibom)
+    second = AIBOMBuilder("Second", "OrgB")
+    second.add_model("GPT-4", "OpenAI", risk=RiskClassification.HIGH)
+    aibom = second.build()
+    aibom.created_at = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    analytics.add_aibom(aibom)
+    return analytics
+
+def test_summary_counts(analytics):
+    """Test group-by counts over all components."""
+    summary = analytics.summary()
+    assert summary["total"] == 4
+    assert summary["aiboms"] == 2
+    assert summary["by_risk"]["high"] == 2
+    assert summary["by_risk"]["minimal"] == 2
+    assert summary["by_type"]["model"] == 3
+    assert summary["by_provider"] == {"OpenAI": 2, "Anthropic": 1, "Internal": 1}
+    assert summary["by_organization"] == {"OrgA": 3, "OrgB": 1}
+
+def test_summary_filters(analytics):
+    """Test filtering by risk and organization."""
+    summary = analytics.summary(
+        risk=RiskClassification.HIGH, organization="OrgA"
+    )
+    assert summary["total"] == 1
+    assert summary["by_provider"] == {"OpenAI": 1}
+    assert analytics.summary(provider="Unknown")["total"] == 0
+
+def test_summary_trend(analytics):
+    """Test monthly trend buckets skip empty periods."""
+    trend = analytics.summary()["trend"]
+    assert [t["period"] for t in trend] == ["2026-01", "2026-03"]
+    assert trend[0]["total"] == 3
+    assert trend[1]["by_risk"]["high"] == 1
+    assert len(analytics.summary(interval="year")["trend"]) == 1
+
+def test_add_component(analytics):
+    """Test components added later are counted."""
+    aibom_id = next(iter(analytics._aibom_index))
+    comp = AIComponent(
+        id="extra",
+        name="Extra",
+        component_type=ComponentType.DATA_SOURCE,
+        risk_classification=RiskClassification.LIMITED,
+    )
+    analytics.add_component(aibom_id, comp)
+    summary = analytics.summary(component_type=ComponentType.DATA_SOURCE)
+    assert summary["total"] == 1
+    assert summary["by_risk"]["limited"] == 1
+
+def test_invalid_interval(analytics):
+    """Test unknown interval is rejected."""
+    with pytest.raises(ValueError):
+        analytics.summary(interval="week")
@@ -1,7 +1,10 @@
 """Test FastAPI routes."""
+import json
 import pytest
 from fastapi.testclient import TestClient
+from pkg.api import routes
 from pkg.api.routes import router
+from pkg.models.aibom import AIBOM, AIComponent, ComponentType
 
 client = TestClient(router)
 
@@ -62,3 +65,146 @@ def test_list_aiboms():
     data = response.json()
     assert "count" in data
     assert "aiboms" in data
+
+def test_risk_analytics():
+    """Test risk analytics endpoint."""
+    client.post(
+        "/v1/aibom/create",
+        json={
+            "name": "Analytics",
+            "organization": "AnalyticsOrg",
+            "components": [
+                {"name": "GPT-4", "component_type": "model", "provider": "OpenAI"}
+            ]
+        }
+    )
+    response = client.get(
+        "/v1/analytics/risk", params={"organization": "AnalyticsOrg"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["by_type"]["model"] == 1
+    bad = client.get("/v1/analytics/risk", params={"interval": "week"})
+    assert bad.status_code == 400
+
+def test_validation_cache_stats():
+    """Test validation cache stats endpoint."""
+    response = client.get("/v1/validator/cache")
+    assert response.status_code == 200
+    assert {"hits", "misses", "size", "maxsize"} <= response.json().keys()
+
+def test_validate_after_add_component():
+    """Test validation sees components added after an earlier run."""
+    aibom_id = client.post("/v1/aibom/create", json={"name": "Revalidated"}).json()["id"]
+    assert client.post(f"/v1/aibom/{aibom_id}/validate").json()["warnings"] == []
+    client.post(
+        "/v1/components",
+        params={"aibom_id": aibom_id},
+        json={"name": "LLM", "component_type": "model"}
+    )
+    warnings = client.post(f"/v1/aibom/{aibom_id}/validate").json()["warnings"]
+    assert warnings == ["Model 'LLM' missing provider"]
+
+def test_get_aibom_version():
+    """Test reading earlier AIBOM versions."""
+    create_resp = client.post(
+        "/v1/aibom/create",
+        json={"name": "Versioned", "organization": ""}
+    )
+    aibom = create_resp.json()
+    add_resp = client.post(
+        "/v1/components",
+        params={"aibom_id": aibom["id"]},
+        json={"name": "Search", "component_type": "tool"}
+    )
+    assert add_resp.json()["version"] == 2
+    v1 = client.get(f"/v1/aibom/{aibom['id']}", params={"version": 1})
+    assert v1.status_code == 200
+    assert v1.json()["components"] == []
+    head = client.get(f"/v1/aibom/{aibom['id']}", params={"version": 2})
+    assert len(head.json()["components"]) == 1
+    at = client.get(
+        f"/v1/aibom/{aibom['id']}", params={"at": aibom["created_at"]}
+    )
+    assert at.json()["components"] == []
+    missing = client.get(f"/v1/aibom/{aibom['id']}", params={"version": 3})
+    assert missing.status_code == 404
+    versions = client.get(f"/v1/aibom/{aibom['id']}/versions")
+    assert [v["version"] for v in versions.json()["versions"]] == [1, 2]
+
+def test_head_version_matches_document_with_reused_id():
+    """Test an added component reusing an ID is appended in both views."""
+    aibom = AIBOM(
+        id="aibom-reused",
+        name="Reused",
+        components=[AIComponent(id="comp-1", name="First", component_type=ComponentType.TOOL)],
+    )
+    routes._store(aibom)
+    add_resp = client.post(
+        "/v1/components",
+        params={"aibom_id": aibom.id},
+        json={"name": "Second", "component_type": "tool"}
+    )
+    assert add_resp.json()["component_id"] == "comp-1"
+    current = client.get(f"/v1/aibom/{aibom.id}").json()
+    head = client.get(
+        f"/v1/aibom/{aibom.id}", params={"version": add_resp.json()["version"]}
+    ).json()
+    assert [c["name"] for c in head["components"]] == ["First", "Second"]
+    assert head["components"] == current["components"]
+
+def test_create_aibom_stream():
+    """Test streaming AIBOM creation."""
+    response = client.post(
+        "/v1/aibom/create/stream",
+        content=json.dumps({
+            "components": [
+                {"name": "GPT-4", "component_type": "model", "provider": "OpenAI"},
+                {"name": "Search", "component_type": "tool"},
+            ],
+            "name": "Streamed",
+        }),
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["name"] == "Streamed"
+    assert summary["component_count"] == 2
+    aibom = client.get(f"/v1/aibom/{summary['id']}").json()
+    assert len(aibom["components"]) == 2
+
+def test_create_aibom_stream_rejects_invalid():
+    """Test streaming creation rejects bad documents."""
+    missing_name = client.post("/v1/aibom/create/stream", content=b'{"components": []}')
+    assert missing_name.status_code == 422
+    malformed = client.post("/v1/aibom/create/stream", content=b'{"name": ')
+    assert malformed.status_code == 422
+
+def test_list_components():
+    """Test filtered, projected and paginated component listing."""
+    create_resp = client.post(
+        "/v1/aibom/create",
+        json={
+            "name": "Listing",
+            "components": [
+                {"name": "GPT-4", "component_type": "model", "provider": "OpenAI"},
+                {"name": "GPT-3.5", "component_type": "model", "provider": "OpenAI"},
+                {"name": "Search", "component_type": "tool"},
+            ]
+        }
+    )
+    aibom_id = create_resp.json()["id"]
+    url = f"/v1/aibom/{aibom_id}/components"
+    first = client.get(
+        url, params={"component_type": "model", "fields": "name", "limit": 1}
+    ).json()
+    assert first["components"] == [{"name": "GPT-4"}]
+    second = client.get(
+        url, params={"component_type": "model", "cursor": first["next_cursor"]}
+    ).json()
+    assert [c["name"] for c in second["components"]] == ["GPT-3.5"]
+    assert second["next_cursor"] is None
+    prefix = client.get(url, params={"name_prefix": "Sea"}).json()
+    assert prefix["count"] == 1
+    assert client.get(url, params={"fields": "bogus"}).status_code == 400
+    assert client.get("/v1/aibom/missing/components").status_code == 404
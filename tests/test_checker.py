@@ -1,7 +1,20 @@
 """Test AIBOMChecker."""
+import os
+import signal
+import subprocess
+import sys
+import time
 import pytest
+from pkg.validator import checker as checker_module, parallel
+from pkg.validator.cache import content_hash
 from pkg.validator.checker import AIBOMChecker
-from pkg.models.aibom import AIBOM, AIComponent, ComponentType, RiskClassification
+from pkg.models.aibom import (
+    AIBOM,
+    AIBOMValidation,
+    AIComponent,
+    ComponentType,
+    RiskClassification,
+)
 
 @pytest.fixture
 def checker():
@@ -70,3 +83,224 @@ def test_validate_model_no_provider(checker):
     result = checker.validate(aibom)
     assert result.valid is True
     assert any("missing provider" in w for w in result.warnings)
+
+def test_validate_cache_hit_ignores_identity(checker):
+    """Test identical content under a new ID is served from cache."""
+    first = AIBOM(id="a", name="Test")
+    first.components = [AIComponent(id="c1", name="M", component_type=ComponentType.MODEL)]
+    second = first.model_copy(update={"id": "b"})
+    checker.validate(first)
+    result = checker.validate(second)
+    assert checker.cache.stats()["hits"] == 1
+    assert checker.cache.stats()["misses"] == 1
+    assert any("missing provider" in w for w in result.warnings)
+
+def test_validate_cache_result_is_isolated(checker):
+    """Test mutating a returned result does not poison the cache."""
+    aibom = AIBOM(name="Test")
+    checker.validate(aibom).errors.append("mutated")
+    assert checker.validate(aibom).errors == []
+
+def test_validate_cache_lru_eviction():
+    """Test least recently used entries are evicted."""
+    checker = AIBOMChecker(cache_size=2)
+    a, b, c = (
+        AIBOM(name=n, components=[AIComponent(id=n, name=n, component_type=ComponentType.TOOL)])
+        for n in "abc"
+    )
+    checker.validate(a)
+    checker.validate(b)
+    checker.validate(a)
+    checker.validate(c)
+    assert len(checker.cache) == 2
+    checker.validate(a)
+    checker.validate(b)
+    assert checker.cache.stats()["hits"] == 2
+    assert checker.cache.stats()["misses"] == 4
+
+def test_validate_cache_cleared_on_ruleset_change(checker):
+    """Test changing the rule-set version invalidates cached results."""
+    aibom = AIBOM(name="Test")
+    checker.validate(aibom)
+    checker.ruleset_version = "2"
+    assert len(checker.cache) == 0
+    checker.validate(aibom)
+    assert checker.cache.stats()["hits"] == 0
+
+def test_validate_cache_hit_cheaper_than_check(checker):
+    """Test a hit with a known content hash costs less than the rules."""
+    aibom = AIBOM(name="Large")
+    aibom.components = [
+        AIComponent(id=f"c{i}", name=f"c{i}", component_type=ComponentType.TOOL)
+        for i in range(50_000)
+    ]
+    aibom.dependencies = [{"from": f"c{i}", "to": "c0"} for i in range(50_000)]
+    start = time.perf_counter()
+    checker._check(aibom)
+    check_time = time.perf_counter() - start
+    digest = content_hash(aibom)
+    checker.validate(aibom, digest)
+    start = time.perf_counter()
+    checker.validate(aibom, digest)
+    hit_time = time.perf_counter() - start
+    assert checker.cache.stats()["hits"] == 1
+    assert hit_time < check_time / 10
+
+def test_validate_cache_tracks_mutation(checker):
+    """Test the cache key follows in-place and replaced-list changes."""
+    aibom = AIBOM(name="Test")
+    aibom.components = [AIComponent(id="c1", name="M", component_type=ComponentType.TOOL)]
+    assert checker.validate(aibom).warnings == []
+    aibom.components[0].component_type = ComponentType.MODEL
+    assert checker.validate(aibom).warnings == ["Model 'M' missing provider"]
+    aibom.components = [AIComponent(id="c1", name="N", component_type=ComponentType.MODEL)]
+    assert checker.validate(aibom).warnings == ["Model 'N' missing provider"]
+    assert checker.cache.stats()["misses"] == 3
+
+def _large_aibom(count):
+    """Build an AIBOM exercising every rule."""
+    aibom = AIBOM(name="Large")
+    aibom.components = [
+        AIComponent(
+            id="" if i % 13 == 0 else f"c{i % 40}" if i > 40 else f"c{i}",
+            name=f"comp-{i}",
+            component_type=ComponentType.MODEL if i % 3 else ComponentType.TOOL,
+            provider="" if i % 5 == 0 else "Provider",
+            risk_classification=RiskClassification.HIGH if i % 7 == 0 else RiskClassification.MINIMAL,
+            description="" if i % 2 else "Described",
+        )
+        for i in range(count)
+    ]
+    aibom.dependencies = [
+        {"from": f"c{i}", "to": f"c{i * 3}"} for i in range(count)
+    ] + [{"from": ""}, {"to": None}]
+    return aibom
+
+@pytest.mark.parametrize("count", [0, 1, 41, 250])
+def test_validate_parallel_matches_serial(count):
+    """Test parallel validation output is identical to serial."""
+    aibom = _large_aibom(count)
+    serial = AIBOMChecker(cache_size=0).validate(aibom)
+    parallel = AIBOMChecker(
+        cache_size=0, workers=2, chunk_size=16, parallel_threshold=0
+    ).validate(aibom)
+    assert parallel == serial
+
+def test_validate_parallel_unique_ids():
+    """Test parallel validation without duplicates or errors."""
+    aibom = AIBOM(name="Unique")
+    aibom.components = [
+        AIComponent(id=f"c{i}", name=f"c{i}", component_type=ComponentType.TOOL)
+        for i in range(50)
+    ]
+    aibom.dependencies = [{"from": "c0", "to": f"c{i}"} for i in range(50)]
+    checker = AIBOMChecker(workers=2, chunk_size=8, parallel_threshold=0)
+    assert checker.validate(aibom) == AIBOMValidation(valid=True)
+
+def test_validate_parallel_long_id():
+    """Test one very long ID is handled like any other."""
+    aibom = _large_aibom(4_000)
+    aibom.components[1] = aibom.components[1].model_copy(update={"id": "x" * 1_000_000})
+    aibom.dependencies.append({"from": "x" * 1_000_000, "to": "x" * 999_999})
+    serial = AIBOMChecker(cache_size=0).validate(aibom)
+    parallel_result = AIBOMChecker(
+        cache_size=0, workers=2, chunk_size=1_000, parallel_threshold=0
+    ).validate(aibom)
+    assert parallel_result == serial
+    assert serial.errors[-1] == f"Dependency references unknown component: {'x' * 999_999}"
+
+def test_validate_parallel_ranges():
+    """Test chunks cover the input evenly across workers."""
+    assert parallel._ranges(0, 16, 2) == ([], [])
+    assert parallel._ranges(10, 4, 2) == ([0, 3, 6, 9], [3, 6, 9, 10])
+    starts, ends = parallel._ranges(5_000, 1_000, 4, 1024)
+    assert starts == [0, 1024, 2048, 3072, 4096] and ends[-1] == 5_000
+    starts, ends = parallel._ranges(20_000, 10_000, 4, 1024)
+    assert starts == [0, 5120, 10240, 15360] and ends[-1] == 20_000
+    starts, ends = parallel._ranges(400_000, 50_000, 8)
+    assert len(starts) == 8 and starts[1:] == ends[:-1]
+
+def test_validate_parallel_needs_fork(monkeypatch):
+    """Test non-fork start methods fall back to serial validation."""
+    aibom = _large_aibom(60)
+    serial = AIBOMChecker(cache_size=0).validate(aibom)
+    checker = AIBOMChecker(
+        cache_size=0, workers=2, chunk_size=16, parallel_threshold=0, start_method="spawn"
+    )
+    monkeypatch.setattr(checker_module, "ParallelValidation", None)
+    assert checker.validate(aibom) == serial
+    with pytest.raises(ValueError):
+        parallel.validate_parallel(aibom, 2, start_method="spawn")
+
+def test_validate_parallel_hashes_before_rules(monkeypatch):
+    """Test the workers' content hash is looked up before running rules."""
+    aibom = _large_aibom(2_500)
+    checker = AIBOMChecker(workers=2, chunk_size=300, parallel_threshold=0)
+    first, digest = checker.validate_with_digest(aibom)
+    assert digest == content_hash(aibom)
+
+    def fail(self):
+        raise AssertionError("rules ran on a cache hit")
+
+    monkeypatch.setattr(parallel.ParallelValidation, "validate", fail)
+    renamed = aibom.model_copy(update={"id": "renamed"})
+    assert checker.validate(renamed) == first
+    assert checker.cache.stats()["hits"] == 1
+
+def _alive(pid):
+    """Whether a process exists and is not a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+def test_validate_parallel_workers_exit_with_parent():
+    """Test pool workers do not outlive a killed parent."""
+    script = (
+        "import os, time\n"
+        "from concurrent.futures import ProcessPoolExecutor\n"
+        "from pkg.validator import parallel\n"
+        "pool = ProcessPoolExecutor(3, initializer=parallel._init_worker, initargs=((), ()))\n"
+        "pool.submit(os.getpid).result()\n"
+        "print(*pool._processes, flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    parent = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    pids = [int(pid) for pid in parent.stdout.readline().split()]
+    assert pids
+    parent.send_signal(signal.SIGKILL)
+    parent.wait()
+    deadline = time.monotonic() + 10
+    while any(map(_alive, pids)) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(map(_alive, pids))
+
+@pytest.mark.benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 cores")
+@pytest.mark.skipif(not parallel.fork_available(), reason="needs fork")
+def test_validate_parallel_scales():
+    """Benchmark cold parallel against serial validation of a large AIBOM."""
+    workers = min(os.cpu_count(), 8)
+    count = 400_000
+    aibom = AIBOM(name="Benchmark")
+    aibom.components = [
+        AIComponent(id=f"component-{i}", name=f"comp-{i}", component_type=ComponentType.TOOL)
+        for i in range(count)
+    ]
+    aibom.dependencies = [
+        {"from": f"component-{i}", "to": f"component-{i * 7 % count}"} for i in range(count)
+    ]
+
+    def timed(checker):
+        start = time.perf_counter()
+        result = checker.validate(aibom)
+        return time.perf_counter() - start, result
+
+    serial_time, serial = timed(AIBOMChecker(cache_size=0))
+    parallel_time, parallel_result = timed(
+        AIBOMChecker(cache_size=0, workers=workers, parallel_threshold=0)
+    )
+    assert parallel_result == serial
+    assert serial_time / parallel_time > 0.6 * workers
@@ -0,0 +1,111 @@
+"""Test AIBOMHistory."""
+import pytest
+from datetime import datetime, timedelta, timezone
+from pkg.history.versions import AIBOMHistory
+from pkg.models.aibom import AIBOM, AIComponent, ComponentType
+
+def _component(comp_id: str) -> AIComponent:
+    return AIComponent(id=comp_id, name=comp_id, component_type=ComponentType.TOOL)
+
+@pytest.fixture
+def history():
+    """Create a history with one initial component."""
+    aibom = AIBOM(
+        id="aibom-1",
+        name="History",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        components=[_component("c0")],
+    )
+    return AIBOMHistory(aibom, min_checkpoint=2)
+
+def test_versions_are_immutable(history):
+    """Test earlier versions are unaffected by later commits."""
+    assert history.commit(added=[_component("c1")]) == 2
+    assert history.commit(added=[_component("c2")], removed_ids=["c0"]) == 3
+    assert [c.id for c in history.get(1).components] == ["c0"]
+    assert [c.id for c in history.get(2).components] == ["c0", "c1"]
+    assert [c.id for c in history.get().components] == ["c1", "c2"]
+
+def test_components_are_shared(history):
+    """Test unchanged components are shared between versions."""
+    history.commit(added=[_component("c1")])
+    assert history.get(1).components[0] is history.get(2).components[0]
+
+def test_replacing_component(history):
+    """Test removing and re-adding an ID replaces the component."""
+    history.commit(
+        added=[_component("c0").model_copy(update={"name": "new"})],
+        removed_ids=["c0"],
+    )
+    assert [c.name for c in history.get().components] == ["new"]
+    assert history.get(1).components[0].name == "c0"
+
+def test_duplicate_ids_survive_checkpoints():
+    """Test components sharing an ID all stay live across checkpoints."""
+    aibom = AIBOM(
+        id="aibom-dup",
+        name="Duplicates",
+        components=[_component("c"), _component("c").model_copy(update={"name": "c2"})],
+    )
+    history = AIBOMHistory(aibom, min_checkpoint=1)
+    history.commit(added=[_component("d")])
+    history.commit(added=[_component("d")])
+    assert [c.name for c in history.get(2).components] == ["c", "c2", "d"]
+    assert [c.id for c in history.get().components] == ["c", "c", "d", "d"]
+    history.commit(removed_ids=["c"])
+    history.compact()
+    assert [c.id for c in history.get().components] == ["d", "d"]
+
+def test_checkpoints_bound_replay(history):
+    """Test checkpoints are written as changes accumulate."""
+    for i in range(1, 10):
+        history.commit(added=[_component(f"c{i}")])
+    checkpoints = [v.checkpoint is not None for v in history._versions]
+    assert 1 < sum(checkpoints) < len(checkpoints)
+    for version in range(1, history.head + 1):
+        assert len(history.get(version).components) == version
+
+def test_compact(history):
+    """Test compaction checkpoints the head without changing content."""
+    history.commit(added=[_component("c1")])
+    before = history.get()
+    history.compact()
+    assert history._versions[-1].checkpoint is not None
+    assert history.get().components == before.components
+
+def test_header_changes(history):
+    """Test header fields are versioned."""
+    history.commit(name="Renamed", dependencies=[{"from": "c0", "to": "c0"}])
+    assert history.get(1).name == "History"
+    assert history.get(1).dependencies == []
+    assert history.get().name == "Renamed"
+    with pytest.raises(ValueError):
+        history.commit(unknown="x")
+
+def test_version_at(history):
+    """Test looking up versions by timestamp."""
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    history.commit(added=[_component("c1")], at=start + timedelta(days=30))
+    assert history.version_at(start) == 1
+    assert history.version_at(start + timedelta(days=31)) == 2
+    assert history.version_at(datetime(2026, 1, 15)) == 1
+    with pytest.raises(KeyError):
+        history.version_at(start - timedelta(days=1))
+
+def test_get_missing_version(history):
+    """Test unknown versions raise KeyError."""
+    with pytest.raises(KeyError):
+        history.get(0)
+    with pytest.raises(KeyError):
+        history.get(2)
+
+def test_rejected_commit_leaves_history_untouched(history):
+    """Test unknown removed IDs are rejected before any change."""
+    history.commit(added=[_component("c1")])
+    with pytest.raises(ValueError):
+        history.commit(removed_ids=["c0", "missing"])
+    assert history.head == 2
+    assert history._live == {"c0": [0], "c1": [1]}
+    history.commit(added=[_component("c2")])
+    history.compact()
+    assert [c.id for c in history.get().components] == ["c0", "c1", "c2"]
@@ -0,0 +1,101 @@
+"""Test ComponentIndex."""
+import pytest
+from pkg.index.components import ComponentIndex
+from pkg.models.aibom import AIComponent, ComponentType, RiskClassification
+
+@pytest.fixture
+def index():
+    """Create an index over mixed components."""
+    return ComponentIndex(
+        AIComponent(
+            id=f"c{i}",
+            name=f"{'gpt' if i % 2 else 'tool'}-{i}",
+            component_type=ComponentType.MODEL if i % 2 else ComponentType.TOOL,
+            provider="OpenAI" if i % 4 == 1 else "Internal",
+            risk_classification=RiskClassification.HIGH if i % 3 == 0 else RiskClassification.MINIMAL,
+            capabilities=["chat"] if i % 5 == 0 else [],
+        )
+        for i in range(30)
+    )
+
+def _ids(page):
+    return [c.id for c in page]
+
+def test_query_all(index):
+    """Test unfiltered query returns components in order."""
+    page, cursor = index.query(limit=100)
+    assert _ids(page) == [f"c{i}" for i in range(30)]
+    assert cursor is None
+
+def test_query_filters(index):
+    """Test combined filters."""
+    page, _ = index.query(
+        component_type=ComponentType.MODEL, risk=RiskClassification.HIGH
+    )
+    assert _ids(page) == ["c3", "c9", "c15", "c21", "c27"]
+    page, _ = index.query(provider="OpenAI", name_prefix="gpt-1")
+    assert _ids(page) == ["c1", "c13", "c17"]
+    page, _ = index.query(capability="chat", component_type=ComponentType.TOOL)
+    assert _ids(page) == ["c0", "c10", "c20"]
+    assert index.query(provider="Nobody") == ([], None)
+
+def test_query_pagination(index):
+    """Test cursor pagination visits every match once."""
+    seen = []
+    cursor = -1
+    while True:
+        page, cursor = index.query(risk=RiskClassification.HIGH, after=cursor, limit=3)
+        seen.extend(_ids(page))
+        if cursor is None:
+            break
+    assert seen == [f"c{i}" for i in range(0, 30, 3)]
+
+def test_add(index):
+    """Test components added later are indexed."""
+    index.add(AIComponent(id="new", name="gpt-new", component_type=ComponentType.MODEL))
+    page, _ = index.query(name_prefix="gpt-n")
+    assert _ids(page) == ["new"]
+    assert len(index) == 31
+
+def test_prefix_paths_agree(index):
+    """Test prefix pages match whether prefixes or filters drive the query."""
+    def pages(limit, **filters):
+        seen, cursor = [], -1
+        while True:
+            page, cursor = index.query(name_prefix="gpt-1", after=cursor, limit=limit, **filters)
+            seen.extend(_ids(page))
+            if cursor is None:
+                return seen
+    expected = ["c1", "c11", "c13", "c15", "c17", "c19"]
+    assert pages(1) == pages(100) == expected
+    assert pages(2, provider="OpenAI") == ["c1", "c13", "c17"]
+    index.add(AIComponent(id="new", name="gpt-1x", component_type=ComponentType.MODEL))
+    assert pages(1) == expected + ["new"]
+
+class _CountingList(list):
+    """List that counts item reads."""
+    reads = 0
+
+    def __getitem__(self, i):
+        self.reads += 1
+        return super().__getitem__(i)
+
+def test_prefix_drives_query_when_smaller():
+    """Test a prefix smaller than the other filters only visits its matches."""
+    index = ComponentIndex(
+        AIComponent(id=f"c{i}", name=f"{'zz' if i >= 9000 else 'aa'}-{i}", component_type=ComponentType.TOOL)
+        for i in range(10_000)
+    )
+    index._components = _CountingList(index._components)
+    page, cursor = index.query(name_prefix="zz", limit=50)
+    assert _ids(page) == [f"c{i}" for i in range(9000, 9050)]
+    assert index._components.reads <= 51
+
+def test_prefix_boundaries():
+    """Test prefix ranges stop at the next prefix."""
+    index = ComponentIndex(
+        AIComponent(id=name, name=name, component_type=ComponentType.TOOL)
+        for name in ["ac", "ab", "abc", "a", "b", "a\U0010ffff"]
+    )
+    assert sorted(_ids(index.query(name_prefix="ab")[0])) == ["ab", "abc"]
+    assert _ids(index.query(name_prefix="a\U0010ffff")[0]) == ["a\U0010ffff"]
@@ -0,0 +1,149 @@
+"""Test AIBOMStreamParser."""
+import json
+import threading
+import tracemalloc
+import pytest
+from pkg.api import routes
+from pkg.api.streaming import AIBOMStreamParser, StreamLimitExceeded, StreamLimits
+
+def _body(count: int):
+    """Yield a create request body in small chunks."""
+    yield b'{"name": "Big", "components": ['
+    for i in range(count):
+        comp = {"name": f"tool-{i}", "component_type": "tool"}
+        yield (b"," if i else b"") + json.dumps(comp).encode()
+    yield b'], "organization": "Org"}'
+
+def _parse(chunks, limits=None):
+    parser = AIBOMStreamParser(limits)
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return parser, items
+
+def test_parse_split_at_every_byte():
+    """Test parsing is independent of chunk boundaries."""
+    body = json.dumps({
+        "name": "Test",
+        "version": 12,
+        "components": [{"name": "GPT-4", "component_type": "model"}, {"name": 'é \\"}]'}],
+        "organization": "Org",
+    }).encode()
+    parser, items = _parse(body[i:i + 1] for i in range(len(body)))
+    assert parser.fields == {"name": "Test", "version": 12, "organization": "Org"}
+    assert items == [{"name": "GPT-4", "component_type": "model"}, {"name": 'é \\"}]'}]
+
+def test_parse_empty_document():
+    """Test parsing documents without components."""
+    parser, items = _parse([b"{}"])
+    assert parser.fields == {} and items == []
+    parser, items = _parse([b'{"name": "x", "components": []}'])
+    assert parser.fields == {"name": "x"} and items == []
+
+def test_parse_large_element_in_small_chunks():
+    """Test an element arriving in many chunks is scanned only once."""
+    name = "x" * 400_000
+    body = json.dumps({"name": "Big", "components": [{"name": name}]}).encode()
+    parser, items = _parse(body[i:i + 16] for i in range(0, len(body), 16))
+    assert items == [{"name": name}]
+
+@pytest.mark.parametrize("body", [
+    b'{"name": "x"',
+    b'{"name": "x"} extra',
+    b'{"components": {}}',
+    b'{"components": [1,]}',
+    b"[]",
+])
+def test_parse_malformed(body):
+    """Test malformed documents are rejected."""
+    with pytest.raises(ValueError):
+        _parse([body])
+
+def test_component_limit():
+    """Test the component-count limit rejects early."""
+    parser = AIBOMStreamParser(StreamLimits(max_components=10))
+    with pytest.raises(StreamLimitExceeded):
+        for chunk in _body(1000):
+            parser.feed(chunk)
+    assert parser.component_count == 11
+
+def test_body_and_item_limits():
+    """Test body and element size limits."""
+    with pytest.raises(StreamLimitExceeded):
+        _parse(_body(100), StreamLimits(max_body_bytes=1000))
+    big = b'{"components": [{"name": "' + b"x" * 5000 + b'"}]}'
+    with pytest.raises(StreamLimitExceeded):
+        _parse([big[i:i + 100] for i in range(0, len(big), 100)],
+               StreamLimits(max_item_bytes=1000))
+
+def test_peak_memory_is_constant():
+    """Test parser memory does not grow with document size."""
+    def peak(count):
+        parser = AIBOMStreamParser()
+        tracemalloc.start()
+        for chunk in _body(count):
+            parser.feed(chunk)
+        parser.close()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    small, large = peak(1_000), peak(20_000)
+    assert large < small * 2
+    assert large < 256 * 1024
+
+async def test_endpoint_peak_memory_excludes_body():
+    """Test the create endpoint never holds the whole body in memory."""
+    count = 5_000
+    body_bytes = sum(len(chunk) for chunk in _body(count))
+    chunks = _body(count)
+    messages = []
+
+    async def receive():
+        chunk = next(chunks, None)
+        return {"type": "http.request", "body": chunk or b"", "more_body": chunk is not None}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "POST", "path": "/v1/aibom/create/stream",
+        "headers": [], "query_string": b"", "http_version": "1.1",
+    }
+    tracemalloc.start()
+    await routes.router(scope, receive, send)
+    retained, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert messages[0]["status"] == 200
+    # Whatever outlives the request is the stored document itself;
+    # the transient overhead on top of it must stay well below the body.
+    assert peak_bytes - retained < body_bytes // 2
+
+async def test_endpoint_stores_on_event_loop(monkeypatch):
+    """Test the streamed document is stored on the loop's thread."""
+    threads = []
+    store = routes._store
+
+    def recording_store(aibom):
+        threads.append(threading.get_ident())
+        store(aibom)
+
+    monkeypatch.setattr(routes, "_store", recording_store)
+    chunks = _body(10)
+    messages = []
+
+    async def receive():
+        chunk = next(chunks, None)
+        return {"type": "http.request", "body": chunk or b"", "more_body": chunk is not None}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "POST", "path": "/v1/aibom/create/stream",
+        "headers": [], "query_string": b"", "http_version": "1.1",
+    }
+    await routes.router(scope, receive, send)
+    assert messages[0]["status"] == 200
+    assert threads == [threading.get_ident()]